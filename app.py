@@ -1,3 +1,6 @@
+import os
+import uuid
+
 import streamlit as st
 
 # Calculation functions
@@ -5,6 +8,9 @@ from calc.arudha_calc import calc_all_arudhas
 from calc.ul_calc import calc_UL
 from data.houses import generate_house_lords
 
+# Event logging
+from eventlog.event_logger import get_event_logger
+
 # Arudha dictionaries
 from dict import AL, A7, A10, UL
 
@@ -33,6 +39,8 @@ ASC_SIGNS = [
 
 ARUDHA_FLOW = ["AL", "A7", "A10", "UL"]
 
+LOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs")
+
 DICT_MAP = {
     "AL": AL.Arudha_dict,
     "A7": A7.Arudha_dict,
@@ -57,6 +65,15 @@ def normalize_text(s:str):
     return s
 
 
+# ============================================================
+# 이벤트 로그 (프로세스당 1개, rerun마다 queue put 한 번)
+# ============================================================
+def log_event(event, **payload):
+    # 이 기능 이전에 초기화된 세션에도 session_id가 생기도록 setdefault
+    session = st.session_state.setdefault("session_id", uuid.uuid4().hex)
+    get_event_logger(LOG_DIR).log(event, session=session, **payload)
+
+
 # ============================================================
 # Streamlit 스타일
 # ============================================================
@@ -129,6 +146,7 @@ def page_input_times():
             "asc": asc,
             "houses": lord_positions
         }
+        log_event("save_next", slot=slot, asc=asc, houses=lord_positions)
 
         if slot < 24:
             st.session_state.current_slot += 1
@@ -245,6 +263,7 @@ def page_question():
     st.divider()
 
     remove_asc = set()
+    answers = []
 
     # UI 문항 출력
     for gi, g in enumerate(ui_groups):
@@ -258,6 +277,7 @@ def page_question():
             key=f"step_{step}_group_{gi}",
             horizontal=True
         )
+        answers.append({"group": gi, "text": g["text"], "answer": answer})
 
         if answer == "no":
             for qid in g["qid_list"]:
@@ -272,11 +292,15 @@ def page_question():
     # 페이지 이동
     if step == len(ARUDHA_FLOW) - 1:
         if st.button("Finish", use_container_width=True):
+            log_event("page", page="result", step=step, arudha=key,
+                      answers=answers, removed=sorted(remove_asc))
             st.session_state.candidates = survivors
             st.session_state.page = "result"
             st.rerun()
     else:
         if st.button("Next", use_container_width=True):
+            log_event("page", page="question", step=step, arudha=key,
+                      answers=answers, removed=sorted(remove_asc))
             st.session_state.candidates = survivors
             st.session_state.question_step += 1
             st.rerun()
@@ -290,13 +314,17 @@ def page_result():
     st.title("🎯 Likely Ascendant(s)")
 
     cands = st.session_state.candidates
+    asc_list = sorted({c["asc"] for c in cands or []})
+
+    # rerun마다 중복 기록하지 않도록 세션당 한 번만 기록
+    if not st.session_state.get("result_logged"):
+        log_event("result", asc_list=asc_list)
+        st.session_state.result_logged = True
 
     if not cands:
         st.error("모든 Asc가 제거되었습니다. 입력값을 다시 확인하세요.")
         return
 
-    asc_list = sorted({c["asc"] for c in cands})
-
     st.write("가능성이 높은 Ascendant:")
 
     for asc in asc_list:
@@ -0,0 +1,251 @@
+# ======================================================
+#   Event Logger — 비동기 버퍼링 이벤트 로그
+#   rerun 경로에서는 queue.put 한 번만 수행하고,
+#   파일 쓰기는 백그라운드 스레드가 배치로 처리
+# ======================================================
+import atexit
+import gzip
+import json
+import os
+import queue
+import threading
+import time
+
+
+# ------------------------------------------------------
+#   종료 신호 (큐에 넣어 writer 스레드를 깨움)
+# ------------------------------------------------------
+_STOP = object()
+
+# 기본 로그 위치: 실행 디렉터리와 무관하게 저장소 루트의 logs/
+DEFAULT_LOG_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "logs"
+)
+
+
+class EventLogger:
+    """
+    append-only 이벤트 로거
+      - log(): 큐에 (ts, event, payload) 튜플 하나를 put_nowait
+      - 큐가 가득 차거나 writer가 멈췄으면 이벤트를 버리고 dropped 증가
+      - writer 스레드: 배치 단위로 gzip JSONL 세그먼트에 기록
+        (직렬화 실패 레코드는 건너뛰고 failed로 집계,
+         쓰기 실패 시 남은 레코드는 failed로 집계하고 다음 배치에서 새 세그먼트)
+      - 세그먼트는 비압축 기준 segment_bytes를 넘거나 segment_age초가 지나면
+        닫고 새 파일로 회전 (닫힌 세그먼트는 실행 중에도 gzip으로 읽을 수 있음)
+      - close(): 남은 이벤트를 flush, 못 쓴 이벤트는 dropped로 집계 (atexit 등록)
+    """
+
+    def __init__(self, log_dir=DEFAULT_LOG_DIR, max_queue=10000,
+                 batch_size=256, flush_interval=1.0,
+                 segment_bytes=4 * 1024 * 1024, segment_age=300.0):
+        self.log_dir = log_dir
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.segment_bytes = segment_bytes
+        self.segment_age = segment_age
+
+        self.queued = 0
+        self.dropped = 0
+        self.written = 0
+        self.failed = 0
+        self.segments = 0
+
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._file = None
+        self._opened = 0.0
+        self._closed = False
+
+        os.makedirs(log_dir, exist_ok=True)
+
+        self._thread = threading.Thread(
+            target=self._run, name="event-logger", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    # --------------------------------------------------
+    #   rerun 경로 — put 한 번
+    #   (Streamlit 세션마다 스레드가 다르므로 카운터는 lock으로 보호)
+    # --------------------------------------------------
+    def log(self, event, **payload):
+        with self._lock:
+            if self._closed:
+                self.dropped += 1
+                return False
+            try:
+                self._queue.put_nowait((time.time(), event, payload))
+            except queue.Full:
+                self.dropped += 1
+                return False
+            self.queued += 1
+            return True
+
+    def stats(self):
+        with self._lock:
+            return {
+                "queued": self.queued,
+                "dropped": self.dropped,
+                "written": self.written,
+                "failed": self.failed,
+                "pending": self._queue.qsize(),
+                "segments": self.segments,
+            }
+
+    def close(self, timeout=5.0):
+        # _closed 이후로는 log()가 큐에 넣지 않으므로 _STOP 뒤에 남는 이벤트가 없음
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+
+        if self._thread.is_alive():
+            try:
+                self._queue.put(_STOP, timeout=timeout)
+            except queue.Full:
+                # writer가 따라가지 못함 — 남은 이벤트는 버리고 종료 신호 전달
+                self._drain()
+                self._queue.put(_STOP)
+            self._thread.join(timeout)
+
+        self._drain()
+        if not self._thread.is_alive():
+            self._close_segment()
+
+    def _drain(self):
+        n = 0
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                n += 1
+        with self._lock:
+            self.dropped += n
+
+    # --------------------------------------------------
+    #   writer 스레드
+    # --------------------------------------------------
+    def _run(self):
+        try:
+            self._loop()
+        finally:
+            # writer가 어떤 이유로든 끝나면 더 이상 이벤트를 받지 않고,
+            # 큐에 남은 이벤트는 dropped로 집계
+            with self._lock:
+                self._closed = True
+            self._drain()
+            self._close_segment()
+
+    def _loop(self):
+        stop = False
+        while not stop:
+            batch = []
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                self._expire_segment()
+                continue
+
+            # 첫 이벤트를 받은 뒤 큐에 쌓인 만큼 batch_size까지 모음
+            while True:
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if batch:
+                try:
+                    self._write_batch(batch)
+                except Exception:
+                    # 예상 못 한 오류도 배치 단위로 failed 집계 후 계속 진행
+                    self._close_segment()
+                    with self._lock:
+                        self.failed += len(batch)
+            self._expire_segment()
+
+    def _write_batch(self, batch):
+        # 직렬화 실패는 해당 레코드만 건너뜀
+        lines = []
+        for ts, event, payload in batch:
+            record = {"ts": ts, "event": event}
+            record.update(payload)
+            try:
+                line = json.dumps(record, ensure_ascii=False, default=str)
+                lines.append((line + "\n").encode("utf-8"))
+            except (TypeError, ValueError, RecursionError):
+                with self._lock:
+                    self.failed += 1
+
+        done = 0
+        try:
+            for data in lines:
+                f = self._segment()
+                f.write(data)
+                done += 1
+                if f.tell() >= self.segment_bytes:
+                    self._close_segment()
+
+            if self._file is not None:
+                self._file.flush()
+        except OSError:
+            # 현재 세그먼트는 버리고 다음 배치에서 새 파일을 연다
+            self._close_segment()
+            with self._lock:
+                self.written += done
+                self.failed += len(lines) - done
+            return
+
+        with self._lock:
+            self.written += done
+
+    # --------------------------------------------------
+    #   세그먼트 파일 회전
+    # --------------------------------------------------
+    def _segment(self):
+        if self._file is None:
+            os.makedirs(self.log_dir, exist_ok=True)
+            stamp = time.strftime("%Y%m%d-%H%M%S")
+            name = f"events-{stamp}-{os.getpid()}-{self.segments:04d}.jsonl.gz"
+            self._file = gzip.open(os.path.join(self.log_dir, name), "wb")
+            self._opened = time.monotonic()
+            self.segments += 1
+        return self._file
+
+    def _expire_segment(self):
+        # 트래픽이 적어도 세그먼트가 오래 열려 있지 않도록 나이 기준으로 닫음
+        if (self._file is not None
+                and time.monotonic() - self._opened >= self.segment_age):
+            self._close_segment()
+
+    def _close_segment(self):
+        f, self._file = self._file, None
+        if f is not None:
+            try:
+                f.close()
+            except OSError:
+                pass
+
+
+# ------------------------------------------------------
+#   프로세스 단위 싱글톤
+#   (Streamlit 캐시가 비워져도 writer/세그먼트가 고아가 되지 않도록)
+# ------------------------------------------------------
+_instance = None
+_instance_lock = threading.Lock()
+
+
+def get_event_logger(log_dir=DEFAULT_LOG_DIR):
+    global _instance
+    with _instance_lock:
+        if _instance is None:
+            _instance = EventLogger(log_dir)
+        return _instance
@@ -0,0 +1,175 @@
+import glob
+import gzip
+import json
+import os
+import shutil
+import threading
+import time
+
+from eventlog.event_logger import EventLogger
+
+
+def read_records(log_dir):
+    records = []
+    for path in sorted(glob.glob(os.path.join(log_dir, "*.jsonl.gz"))):
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            records.extend(json.loads(line) for line in f)
+    return records
+
+
+def wait_until(cond, timeout=5.0):
+    end = time.time() + timeout
+    while not cond():
+        if time.time() > end:
+            raise AssertionError("timed out")
+        time.sleep(0.01)
+
+
+def test_full_queue_counts_dropped(tmp_path):
+    logger = EventLogger(str(tmp_path), max_queue=3)
+
+    # writer가 첫 배치에서 멈추도록 막아서 큐를 채운다
+    entered = threading.Event()
+    release = threading.Event()
+    write_batch = logger._write_batch
+
+    def blocked(batch):
+        entered.set()
+        release.wait()
+        write_batch(batch)
+
+    logger._write_batch = blocked
+
+    assert logger.log("first")
+    assert entered.wait(5.0)
+    for i in range(3):
+        assert logger.log("fill", i=i)
+    assert not logger.log("overflow")
+
+    release.set()
+    logger.close()
+
+    stats = logger.stats()
+    assert stats["queued"] == 4
+    assert stats["dropped"] == 1
+    assert stats["written"] == 4
+    assert len(read_records(str(tmp_path))) == 4
+
+
+def test_close_flushes_all_accepted_records(tmp_path):
+    logger = EventLogger(str(tmp_path), batch_size=16)
+    for i in range(500):
+        assert logger.log("answer", i=i, text="가나다")
+    logger.close()
+
+    records = read_records(str(tmp_path))
+    assert [r["i"] for r in records] == list(range(500))
+    assert records[0]["event"] == "answer"
+    assert records[0]["text"] == "가나다"
+    assert logger.stats()["written"] == 500
+    assert not logger.log("late")
+    assert logger.stats()["dropped"] == 1
+
+
+def test_small_segment_bytes_rotates(tmp_path):
+    logger = EventLogger(str(tmp_path), segment_bytes=200)
+    for i in range(40):
+        logger.log("answer", i=i)
+    logger.close()
+
+    segments = glob.glob(os.path.join(str(tmp_path), "*.jsonl.gz"))
+    assert len(segments) > 1
+    assert logger.stats()["segments"] == len(segments)
+    assert [r["i"] for r in read_records(str(tmp_path))] == list(range(40))
+
+
+def test_write_failure_is_counted_and_writer_recovers(tmp_path):
+    log_dir = str(tmp_path / "logs")
+    logger = EventLogger(log_dir)
+
+    # 로그 디렉터리 자리에 일반 파일을 두어 세그먼트 생성을 실패시킨다
+    shutil.rmtree(log_dir)
+    open(log_dir, "w").close()
+
+    logger.log("lost")
+    wait_until(lambda: logger.stats()["failed"] == 1)
+    assert logger._thread.is_alive()
+
+    os.remove(log_dir)
+    assert logger.log("kept")
+    logger.close()
+
+    stats = logger.stats()
+    assert stats["failed"] == 1
+    assert stats["written"] == 1
+    assert [r["event"] for r in read_records(log_dir)] == ["kept"]
+
+
+def test_unserializable_record_only_fails_itself(tmp_path):
+    logger = EventLogger(str(tmp_path))
+
+    # 세 레코드가 한 배치로 묶이도록 writer를 잠시 막는다
+    entered = threading.Event()
+    release = threading.Event()
+    write_batch = logger._write_batch
+
+    def blocked(batch):
+        entered.set()
+        release.wait()
+        write_batch(batch)
+
+    logger._write_batch = blocked
+
+    logger.log("warmup")
+    assert entered.wait(5.0)
+
+    loop = {}
+    loop["self"] = loop
+    logger.log("good1")
+    logger.log("bad", payload=loop)
+    logger.log("good2")
+
+    release.set()
+    logger.close()
+
+    stats = logger.stats()
+    assert stats["written"] == 3
+    assert stats["failed"] == 1
+    events = [r["event"] for r in read_records(str(tmp_path))]
+    assert events == ["warmup", "good1", "good2"]
+
+
+def test_old_segment_is_closed_and_readable(tmp_path):
+    logger = EventLogger(str(tmp_path), flush_interval=0.01, segment_age=0.05)
+    logger.log("answer", i=1)
+
+    # 프로세스가 살아 있는 동안에도 세그먼트를 끝까지 읽을 수 있어야 함
+    wait_until(lambda: logger.stats()["written"] == 1 and logger._file is None)
+    assert [r["i"] for r in read_records(str(tmp_path))] == [1]
+
+    logger.log("answer", i=2)
+    logger.close()
+    assert logger.stats()["segments"] == 2
+
+
+def test_unexpected_error_is_counted_and_writer_continues(tmp_path):
+    logger = EventLogger(str(tmp_path))
+    write_batch = logger._write_batch
+    calls = []
+
+    def crash_once(batch):
+        calls.append(len(batch))
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        write_batch(batch)
+
+    logger._write_batch = crash_once
+
+    logger.log("lost")
+    wait_until(lambda: logger.stats()["failed"] == 1)
+    assert logger.log("kept")
+    logger.close()
+
+    stats = logger.stats()
+    assert stats["queued"] == stats["written"] + stats["failed"]
+    assert [r["event"] for r in read_records(str(tmp_path))] == ["kept"]